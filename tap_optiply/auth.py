@@ -2,13 +2,13 @@
 import base64
 import json
 import argparse
-from datetime import datetime
-from typing import Dict, Optional
+import threading
+import time
+from typing import Dict, Optional, Tuple
 
 import requests
 from singer_sdk.authenticators import OAuthAuthenticator
 from singer_sdk.streams import RESTStream
-from singer_sdk._singerlib import Message
 
 
 class OptiplyAuthenticator(OAuthAuthenticator):
@@ -17,9 +17,13 @@ class OptiplyAuthenticator(OAuthAuthenticator):
     # Fixed token URL that will never change
     TOKEN_URL = "https://dashboard.optiply.nl/api/auth/oauth/token"
     
-    # Store token in class variables
-    _access_token = None
-    _token_expires_at = None
+    # Tokens are stored on the class, shared by all streams authenticating
+    # with the same client and user, so a run refreshes the token once
+    # instead of per stream
+    _tokens: Dict[Tuple[str, str], dict] = {}
+
+    # Streams sync in parallel, only one of them may refresh the token at a time
+    _refresh_lock = threading.Lock()
 
     def __init__(
         self,
@@ -33,9 +37,40 @@ class OptiplyAuthenticator(OAuthAuthenticator):
         self._stream = stream
         super().__init__(stream=stream)
         
-        # Initialize token from config if available
-        self._access_token = stream.config.get("access_token")
-        self._token_expires_at = stream.config.get("token_expires_at")
+        # Initialize the shared token from config if no stream did so yet
+        config_token = {
+            "access_token": stream.config.get("access_token"),
+            "token_expires_at": stream.config.get("token_expires_at"),
+        }
+        key = (stream.config.get("client_id"), stream.config.get("username"))
+        with self._refresh_lock:
+            self._shared_token = self._tokens.setdefault(key, config_token)
+            # A config token that outlives the shared one replaces it
+            if config_token["access_token"] and (
+                (config_token["token_expires_at"] or 0)
+                > (self._shared_token["token_expires_at"] or 0)
+            ):
+                self._shared_token.update(config_token)
+
+    @property
+    def _access_token(self) -> Optional[str]:
+        """Get the access token shared by all streams."""
+        return self._shared_token["access_token"]
+
+    @_access_token.setter
+    def _access_token(self, value: Optional[str]) -> None:
+        """Set the access token shared by all streams."""
+        self._shared_token["access_token"] = value
+
+    @property
+    def _token_expires_at(self) -> Optional[int]:
+        """Get the expiration timestamp of the shared access token."""
+        return self._shared_token["token_expires_at"]
+
+    @_token_expires_at.setter
+    def _token_expires_at(self, value: Optional[int]) -> None:
+        """Set the expiration timestamp of the shared access token."""
+        self._shared_token["token_expires_at"] = value
 
     def update_config(self, new_fields: Dict[str, str]) -> None:
         """Update the config.
@@ -101,12 +136,33 @@ class OptiplyAuthenticator(OAuthAuthenticator):
         if not self._token_expires_at:
             return False
 
-        now = round(datetime.utcnow().timestamp())
+        now = round(time.time())
         # Use a 5-minute buffer instead of 2 minutes
         return not ((self._token_expires_at - now) < 300)
 
     def update_access_token(self) -> None:
         """Update the access token using the OAuth credentials."""
+        with self._refresh_lock:
+            # Another stream may have refreshed the token while we waited
+            if self.is_token_valid():
+                return
+            self._update_access_token()
+
+    def invalidate_token(self, access_token: Optional[str]) -> None:
+        """Drop the shared token after the API rejected it.
+
+        The token is only dropped if it is still the one that was rejected, so
+        a token another stream refreshed in the meantime is kept.
+
+        Args:
+            access_token: The token the rejected request was sent with.
+        """
+        with self._refresh_lock:
+            if self._access_token == access_token:
+                self._access_token = None
+
+    def _update_access_token(self) -> None:
+        """Request a new access token and store it in the config."""
         try:
             # Create Basic Auth header
             auth_string = f"{self.stream.config['client_id']}:{self.stream.config['client_secret']}"
@@ -135,9 +191,9 @@ class OptiplyAuthenticator(OAuthAuthenticator):
             token_response.raise_for_status()
             token_json = token_response.json()
 
-            # Update the class variables with new token
+            # Update the shared token
             self._access_token = token_json["access_token"]
-            now = round(datetime.utcnow().timestamp())
+            now = round(time.time())
             self._token_expires_at = now + int(token_json["expires_in"])
             
             # Update config with new token and expiration
@@ -150,7 +206,7 @@ class OptiplyAuthenticator(OAuthAuthenticator):
             
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Failed to refresh access token: {str(e)}")
-            if hasattr(e.response, 'text'):
+            if e.response is not None:
                 self.logger.error(f"Response content: {e.response.text}")
             raise RuntimeError(f"Failed to refresh access token: {str(e)}")
         except Exception as e:
@@ -3,21 +3,57 @@
 from __future__ import annotations
 
 import typing as t
-from datetime import datetime
-from urllib.parse import parse_qsl, urlparse
-import time
-
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+import functools
+import itertools
+import logging
+import queue
+import threading
+
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from singer_sdk import typing as th  # JSON schema typing helpers
 from singer_sdk.authenticators import OAuthAuthenticator
-from singer_sdk.helpers.jsonpath import extract_jsonpath
+from singer_sdk.helpers._typing import TypeConformanceLevel
 from singer_sdk.streams import RESTStream
 
 from tap_optiply.auth import OptiplyAuthenticator
 
-if t.TYPE_CHECKING:
-    from singer_sdk.helpers.typing import Context
+# Connections kept open to the Optiply API, shared by all streams
+MAX_CONNECTION_POOL_SIZE = 50
+
+
+def split_time_range(
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+) -> t.Iterator[tuple[str, str]]:
+    """Split a time range into consecutive windows.
+
+    Args:
+        start: Start of the range (exclusive).
+        end: End of the range (inclusive).
+        step: Length of each window.
+
+    Yields:
+        (lower, upper) ISO 8601 bounds of each window.
+
+    Raises:
+        ValueError: If the step is not positive.
+    """
+    if step <= timedelta(0):
+        raise ValueError(f"Time window length must be positive, got {step}.")
+
+    lower = start
+    while lower < end:
+        upper = min(lower + step, end)
+        yield lower.isoformat(), upper.isoformat()
+        lower = upper
 
 
 class OptiplyStream(RESTStream):
@@ -29,8 +65,12 @@ class OptiplyStream(RESTStream):
     # Default HTTP method
     http_method = "GET"
 
-    # Required headers
-    http_headers = {"Content-Type": "application/vnd.api+json"}
+    # Required headers, asking for compressed responses since requests are
+    # prepared outside the session and don't get its default headers
+    http_headers = {
+        "Content-Type": "application/vnd.api+json",
+        "Accept-Encoding": "gzip, deflate",
+    }
 
     # Base URL
     url_base = "https://api.optiply.com/v1"
@@ -41,37 +81,107 @@ class OptiplyStream(RESTStream):
     retry_backoff_factor = 1
     retry_status_forcelist = [408, 429, 500, 502, 503, 504]
 
+    # Records are flat JSON:API attributes, only conform the top level. Nested
+    # free-form objects like remoteIdMap are passed through as-is.
+    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.ROOT_ONLY
+
+    # Properties of the stream records, set by each stream. They are turned
+    # into the JSON schema on first use and shared by all instances.
+    schema_properties: t.ClassVar[th.PropertiesList]
+
+    # Streams with enabled = False are left out of discovery
+    enabled = True
+
+    # Parallel updatedAt windows fetched during a partitioned initial sync
+    partition_max_workers = 6
+    # Pages each window may buffer ahead of the consumer
+    partition_max_buffered_pages = 2
+
+    # Records are requested in ascending replication key order, so the
+    # bookmark the SDK advances per record is safe to resume from whenever a
+    # STATE message is written mid-sync.
+    is_sorted = True
+
+    # Session shared by every stream so connections are reused across streams
+    _shared_session: t.ClassVar[requests.Session | None] = None
+    _shared_session_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         """Initialize the stream."""
         super().__init__(*args, **kwargs)
-        self._authenticator = None
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=self.retry_backoff_factor,
-            status_forcelist=self.retry_status_forcelist,
-        )
-        
-        # Create a session with the retry strategy
-        self._session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
+        # Use the shared session instead of the one the SDK made for this stream
+        self._requests_session = self._get_shared_session()
+
+        # Incremental filter parameter and start date, resolved once per stream.
+        # The filter is inclusive, so records updated at the same instant as the
+        # bookmark are not lost; the ones already synced are sent again and
+        # deduplicated by targets on the id primary key.
+        self._replication_filter_key = f"filter[{self.replication_key or 'updatedAt'}][GTE]"
+        start_date = self.config.get("start_date")
+        self._start_date = start_date.replace("Z", "+00:00") if start_date else None
+
+    @classmethod
+    def _get_shared_session(cls) -> requests.Session:
+        """Return the session shared by all streams, creating it on first use.
+
+        Returns:
+            A session with a pooled, retrying HTTP adapter.
+        """
+        with OptiplyStream._shared_session_lock:
+            if OptiplyStream._shared_session is None:
+                # Configure retry strategy. Timeouts and retryable statuses are
+                # retried with backoff by urllib3, once retries run out the last
+                # response is returned so its error body can be reported.
+                retry_strategy = Retry(
+                    total=cls.max_retries,
+                    backoff_factor=cls.retry_backoff_factor,
+                    status_forcelist=cls.retry_status_forcelist,
+                    allowed_methods=frozenset(["GET"]),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+
+                # Create a session with the retry strategy and a pool large
+                # enough for all streams syncing in parallel
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=MAX_CONNECTION_POOL_SIZE,
+                    pool_maxsize=MAX_CONNECTION_POOL_SIZE,
+                    max_retries=retry_strategy,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                OptiplyStream._shared_session = session
+
+            return OptiplyStream._shared_session
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_schema(cls) -> dict:
+        """Build the JSON schema of the stream, once per stream class.
+
+        Returns:
+            The JSON schema dictionary.
+        """
+        return cls.schema_properties.to_dict()
 
     @property
+    def schema(self) -> dict:
+        """Get the stream schema, built on first access.
+
+        Returns:
+            The JSON schema dictionary.
+        """
+        return self._build_schema()
+
+    @functools.cached_property
     def authenticator(self) -> OAuthAuthenticator:
-        """Return a new authenticator object.
+        """Return the authenticator of the stream, created on first use.
 
         Returns:
             An authenticator instance.
         """
-        if not self._authenticator:
-            self._authenticator = OptiplyAuthenticator(
-                stream=self,
-            )
-
-        return self._authenticator
+        return OptiplyAuthenticator(stream=self)
 
     def get_new_paginator(self):
         """Get a fresh paginator for this API endpoint.
@@ -81,6 +191,34 @@ class OptiplyStream(RESTStream):
         """
         return None
 
+    @functools.cached_property
+    def base_url_params(self) -> t.Mapping[str, t.Any]:
+        """URL parameters sent with every first-page request of the stream.
+
+        Returns:
+            A read-only mapping of URL query parameters.
+        """
+        return MappingProxyType({
+            # Page limit
+            "page[limit]": self.page_size,
+            # Account ID filter
+            "filter[accountId]": self.config["account_id"],
+            # Sort ascending on the replication key so state can advance per page
+            "sort": self.replication_key or "updatedAt",
+        })
+
+    def get_bookmark(self, context: dict | None) -> str | None:
+        """Return the replication key value stored in state, if any.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The bookmark, also accepting the SDK's standard bookmark key.
+        """
+        state = self.get_context_state(context) or {}
+        return state.get(self.replication_key) or state.get("replication_key_value")
+
     def get_url_params(
         self,
         context: dict | None,
@@ -95,31 +233,23 @@ class OptiplyStream(RESTStream):
         Returns:
             Dictionary of URL query parameters.
         """
-        # Get pagination parameters from parent class
-        params = super().get_url_params(context, next_page_token)
-
-        # Add page limit parameter
-        params["page[limit]"] = self.page_size
-
-        # Add account ID filter
-        params["filter[accountId]"] = self.config["account_id"]
-
-        # Get state for replication key
-        state = self.get_context_state(context)
-        replication_key_value = None
+        # Get pagination parameters from parent class, plus the fixed ones
+        params = {
+            **super().get_url_params(context, next_page_token),
+            **self.base_url_params,
+        }
 
-        if state:
+        # Push the bookmark to the API so only changed records are returned
+        if self.replication_key:
             # Try to get the value from state first
-            replication_key_value = state.get(self.replication_key)
+            replication_key_value = self.get_bookmark(context)
             if replication_key_value:
                 self.logger.info(f"Using state value for {self.replication_key}: {replication_key_value}")
-                params["filter[updatedAt][GT]"] = replication_key_value.replace("Z", "+00:00")
-            else:
+                params[self._replication_filter_key] = replication_key_value.replace("Z", "+00:00")
+            elif self._start_date:
                 # Fall back to start_date from config if no state
-                start_date = self.config.get("start_date")
-                if start_date:
-                    self.logger.info(f"Using start_date from config: {start_date}")
-                    params["filter[updatedAt][GT]"] = start_date.replace("Z", "+00:00")
+                self.logger.info(f"Using start_date from config: {self._start_date}")
+                params[self._replication_filter_key] = self._start_date
 
         # Log the final parameters for debugging
         self.logger.info("Request parameters: %s", params)
@@ -138,27 +268,93 @@ class OptiplyStream(RESTStream):
         Yields:
             One item per (possibly processed) record in the API.
         """
-        next_page_token: int | None = None
-        finished = False
-        max_updated_at = None
+        windows = self.get_time_partitions(context)
+        if windows:
+            pages = self._request_partitioned_pages(context, windows)
+        else:
+            pages = self._request_pages(context)
+
+        # The SDK moves the bookmark forward on every record it receives
+        for records in pages:
+            record_count = 0
+            for record in records:
+                record_count += 1
+                processed_record = self.post_process(record, context)
+                if processed_record:
+                    yield processed_record
+
+            self.logger.info(f"Parsed {record_count} records from response")
+
+    def _request_pages(
+        self,
+        context: dict | None,
+        extra_params: dict | None = None,
+    ) -> t.Iterator[t.Iterable[dict]]:
+        """Request all pages of the stream, following the next links.
+
+        The next page is requested in the background as soon as a response
+        arrives, so it downloads while the current page is being processed.
+
+        Args:
+            context: Stream partition or context dictionary.
+            extra_params: URL parameters added to the first page request.
+
+        Yields:
+            The raw records of each page.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._fetch_page, context, None, extra_params)
+            while future is not None:
+                page = future.result()
+
+                next_page_token = self.get_next_link(page)
+                future = None
+                if next_page_token:
+                    future = executor.submit(
+                        self._fetch_page, context, next_page_token, extra_params
+                    )
+
+                # Records are parsed lazily as the caller iterates the page
+                yield self.get_page_records(page)
+
+    def _fetch_page(
+        self,
+        context: dict | None,
+        next_page_token: t.Any | None,
+        extra_params: dict | None = None,
+    ) -> dict:
+        """Request a single page, retrying with a fresh token on 401 responses.
+
+        Args:
+            context: Stream partition or context dictionary.
+            next_page_token: Token for the page to request.
+            extra_params: URL parameters added when not following a next link.
+
+        Returns:
+            The decoded JSON body of the successful response.
+        """
         retry_count = 0
 
-        while not finished:
+        while True:
             try:
                 prepared_request = self.prepare_request(
                     context,
                     next_page_token=next_page_token,
+                    extra_params=extra_params,
                 )
                 self.logger.info(f"Making request to: {prepared_request.url}")
                 self.logger.info(f"Request headers: {prepared_request.headers}")
                 
-                resp = self._session.send(prepared_request, timeout=self.request_timeout)
+                resp = self.requests_session.send(prepared_request, timeout=self.request_timeout)
                 self.logger.info(f"Response received with status code: {resp.status_code}")
                 
                 if resp.status_code == 401:
                     self.logger.info("Received 401 error, attempting to refresh token...")
-                    # Force token refresh by clearing the current token
-                    self.authenticator._access_token = None
+                    # Force a token refresh, unless another stream already did
+                    rejected_token = prepared_request.headers.get("Authorization", "")
+                    self.authenticator.invalidate_token(
+                        rejected_token.removeprefix("Bearer ")
+                    )
                     if retry_count < self.max_retries:
                         retry_count += 1
                         continue
@@ -167,69 +363,131 @@ class OptiplyStream(RESTStream):
                         raise requests.exceptions.HTTPError(f"HTTP {resp.status_code}: {resp.text}")
                 elif resp.status_code != 200:
                     self.logger.error(f"Error response from API: {resp.text}")
-                    if resp.status_code == 504:
-                        if retry_count < self.max_retries:
-                            retry_count += 1
-                            wait_time = self.retry_backoff_factor * (2 ** (retry_count - 1))
-                            self.logger.info(f"Gateway timeout. Retrying in {wait_time} seconds... (Attempt {retry_count}/{self.max_retries})")
-                            time.sleep(wait_time)
-                            continue
                     raise requests.exceptions.HTTPError(f"HTTP {resp.status_code}: {resp.text}")
-                
-                records = list(self.parse_response(resp))
-                self.logger.info(f"Parsed {len(records)} records from response")
-                
-                # Update max_updated_at if we have records
-                if records:
-                    for record in records:
-                        # Try to get updatedAt from attributes first
-                        updated_at = (record.get('attributes', {}) or {}).get('updatedAt')
-                        if not updated_at:
-                            # If not in attributes, try root level
-                            updated_at = record.get('updatedAt')
-                        
-                        if updated_at:
-                            if max_updated_at is None or updated_at > max_updated_at:
-                                max_updated_at = updated_at
-
-                # Process and yield records
-                for record in records:
-                    processed_record = self.post_process(record, context)
-                    if processed_record:
-                        yield processed_record
-
-                next_page_token = self.get_next_page_token(resp, next_page_token)
-                if not next_page_token:
-                    finished = True
-                
-            except requests.exceptions.Timeout as e:
-                self.logger.error(f"Request timed out: {str(e)}")
-                if retry_count < self.max_retries:
-                    retry_count += 1
-                    wait_time = self.retry_backoff_factor * (2 ** (retry_count - 1))
-                    self.logger.info(f"Request timed out. Retrying in {wait_time} seconds... (Attempt {retry_count}/{self.max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                raise
+
+                return self.decode_response(resp)
+
             except Exception as e:
                 self.logger.error(f"Error during record retrieval: {str(e)}")
                 raise
-                
-        # Update state with the maximum updatedAt value after all records are processed
-        if max_updated_at:
-            state_record = {'attributes': {'updatedAt': max_updated_at}}
-            self._increment_stream_state(state_record, context=context)
+
+    def get_time_partitions(self, context: dict | None) -> list[tuple[str, str]]:
+        """Return the updatedAt windows to fetch in parallel, if any.
+
+        Only initial syncs are partitioned: once the stream has a bookmark the
+        remaining window is small and is paged through sequentially.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            A list of (lower, upper) bounds, or an empty list to not partition.
+        """
+        partition_days = self.config.get("time_partition_days")
+        if not partition_days or not self._start_date:
+            return []
+
+        if self.get_bookmark(context):
+            return []
+
+        start = datetime.fromisoformat(self._start_date)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        end = datetime.now(timezone.utc)
+        if end - start <= timedelta(days=partition_days):
+            return []
+
+        return list(split_time_range(start, end, timedelta(days=partition_days)))
+
+    def _request_partitioned_pages(
+        self,
+        context: dict | None,
+        windows: list[tuple[str, str]],
+    ) -> t.Iterator[t.Iterable[dict]]:
+        """Fetch updatedAt windows in parallel and yield their pages in order.
+
+        Windows are consumed oldest first, so records keep coming out sorted by
+        updatedAt. Each window hands its pages over through a bounded queue, so
+        at most `partition_max_buffered_pages` pages per window are held in
+        memory. When the caller stops early or a window fails, the remaining
+        windows are cancelled without waiting for them.
+
+        Args:
+            context: Stream partition or context dictionary.
+            windows: The (lower, upper) updatedAt bounds to fetch.
+
+        Yields:
+            The raw records of each page.
+
+        Raises:
+            Exception: The error of the first window that failed.
+        """
+        self.logger.info(f"Fetching {len(windows)} updatedAt windows in parallel")
+        upper_filter_key = f"filter[{self.replication_key or 'updatedAt'}][LTE]"
+        stopped = threading.Event()
+        window_done = object()
+
+        def put(pages: queue.Queue, item: object) -> bool:
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch_window(window: tuple[str, str], pages: queue.Queue) -> None:
+            lower, upper = window
+            extra_params = {
+                self._replication_filter_key: lower,
+                upper_filter_key: upper,
+            }
+            window_pages = self._request_pages(context, extra_params=extra_params)
+            try:
+                for page in window_pages:
+                    if not put(pages, page):
+                        return
+            finally:
+                window_pages.close()
+                # Also sent on errors, so the consumer wakes up and raises them
+                put(pages, window_done)
+
+        executor = ThreadPoolExecutor(max_workers=self.partition_max_workers)
+        pending: deque[tuple[Future, queue.Queue]] = deque()
+
+        def submit(window: tuple[str, str]) -> None:
+            pages: queue.Queue = queue.Queue(maxsize=self.partition_max_buffered_pages)
+            pending.append((executor.submit(fetch_window, window, pages), pages))
+
+        try:
+            windows_iter = iter(windows)
+            for window in itertools.islice(windows_iter, self.partition_max_workers):
+                submit(window)
+            while pending:
+                future, pages = pending.popleft()
+                for window in itertools.islice(windows_iter, 1):
+                    submit(window)
+                page = pages.get()
+                while page is not window_done:
+                    yield page
+                    page = pages.get()
+                future.result()
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def prepare_request(
         self,
         context: dict | None,
         next_page_token: t.Any | None = None,
+        extra_params: dict | None = None,
     ) -> requests.PreparedRequest:
         """Prepare a request object.
 
         Args:
             context: Stream partition or context dictionary.
             next_page_token: Token for next page of results.
+            extra_params: URL parameters added when not following a next link.
 
         Returns:
             A prepared request object.
@@ -241,9 +499,11 @@ class OptiplyStream(RESTStream):
         else:
             url = self.get_url(context)
             params = self.get_url_params(context, next_page_token)
+            if extra_params:
+                params.update(extra_params)
 
         request_data = self.prepare_request_payload(context, next_page_token)
-        headers = self.http_headers
+        headers = dict(self.http_headers)
 
         authenticator = self.authenticator
         if authenticator:
@@ -291,16 +551,137 @@ class OptiplyStream(RESTStream):
             latest_record: Latest record to use for updating state.
             context: Stream partition or context dictionary.
         """
-        state = self.get_context_state(context) or {}
         replication_key_value = self.get_replication_key_value(latest_record)
 
         if replication_key_value is None:
             return
 
-        current_value = state.get(self.replication_key)
-        if not current_value or replication_key_value > current_value:
-            state[self.replication_key] = replication_key_value
-            self.state = state
+        with self.state_lock:
+            state = self.get_context_state(context)
+            current_value = state.get(self.replication_key)
+            if not current_value or replication_key_value > current_value:
+                state[self.replication_key] = replication_key_value
+
+    # Streams sync in parallel and all of them keep their bookmarks in the one
+    # tap state dict, so every SDK method that changes or snapshots that dict
+    # runs under the tap's lock.
+
+    @property
+    def state_lock(self) -> threading.RLock:
+        """Return the lock guarding the tap state shared by all streams.
+
+        Returns:
+            The tap's re-entrant write lock.
+        """
+        return self._tap._write_lock
+
+    @property
+    def stream_state(self) -> dict:
+        """Get the writable state of the stream, creating it if needed.
+
+        Returns:
+            A writable state dict for this stream.
+        """
+        with self.state_lock:
+            return super().stream_state
+
+    def get_context_state(self, context: dict | None) -> dict:
+        """Return the writable state of the given context, creating it if needed.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            A partitioned context state if applicable, else the stream state.
+        """
+        with self.state_lock:
+            return super().get_context_state(context)
+
+    def _write_replication_key_signpost(self, context: dict | None, value: t.Any) -> None:
+        """Store the replication key signpost in state.
+
+        Args:
+            context: Stream partition or context dictionary.
+            value: The signpost value.
+        """
+        with self.state_lock:
+            super()._write_replication_key_signpost(context, value)
+
+    def _write_starting_replication_value(self, context: dict | None) -> None:
+        """Store the starting replication value in state.
+
+        Args:
+            context: Stream partition or context dictionary.
+        """
+        with self.state_lock:
+            super()._write_starting_replication_value(context)
+
+    def _finalize_state(self, state: dict | None = None) -> None:
+        """Promote the progress markers of a state.
+
+        Args:
+            state: State object to promote progress markers with.
+        """
+        with self.state_lock:
+            super()._finalize_state(state)
+
+    def finalize_state_progress_markers(self, state: dict | None = None) -> None:
+        """Promote the progress markers of the stream and write its state.
+
+        Args:
+            state: State object to promote progress markers with.
+        """
+        with self.state_lock:
+            super().finalize_state_progress_markers(state)
+
+    def _write_state_message(self) -> None:
+        """Write a STATE message with a consistent snapshot of the tap state."""
+        with self.state_lock:
+            super()._write_state_message()
+
+    def decode_response(self, response: requests.Response) -> dict:
+        """Decode the JSON body of a response with orjson.
+
+        Args:
+            response: The response from the API.
+
+        Returns:
+            The decoded JSON:API document.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Response headers: {response.headers}")
+            self.logger.debug(f"Response body: {response.content[:1000]!r}")  # Log first 1000 bytes
+
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse JSON response: {e}")
+            self.logger.error(f"Response text: {response.text}")
+            raise
+
+    @staticmethod
+    def get_next_link(page: dict) -> str | None:
+        """Return the link to the page after a decoded page, if any.
+
+        Args:
+            page: A decoded JSON:API document.
+
+        Returns:
+            The next page URL or None if this is the last page.
+        """
+        return (page.get("links") or {}).get("next") or None
+
+    @staticmethod
+    def get_page_records(page: dict) -> t.Iterator[dict]:
+        """Return an iterator over the records of a decoded page.
+
+        Args:
+            page: A decoded JSON:API document.
+
+        Returns:
+            An iterator of raw records.
+        """
+        return iter(page.get("data") or [])
 
     def get_next_page_token(
         self,
@@ -316,13 +697,7 @@ class OptiplyStream(RESTStream):
         Returns:
             Next page token or None if no more pages.
         """
-        data = response.json()
-        
-        # If we have a next link, use it directly
-        if "links" in data and "next" in data["links"] and data["links"]["next"]:
-            return data["links"]["next"]
-            
-        return None
+        return self.get_next_link(self.decode_response(response))
 
     def parse_response(self, response: requests.Response) -> t.Iterable[dict]:
         """Parse the response and return an iterator of result records.
@@ -330,22 +705,10 @@ class OptiplyStream(RESTStream):
         Args:
             response: The response from the API.
 
-        Yields:
-            Each record from the source.
+        Returns:
+            An iterator of records from the source.
         """
-        self.logger.info(f"Response status code: {response.status_code}")
-        self.logger.info(f"Response headers: {response.headers}")
-        self.logger.info(f"Response text: {response.text[:1000]}")  # Log first 1000 chars
-        
-        try:
-            data = response.json()
-            records = data.get("data", [])
-            for record in records:
-                yield record
-        except requests.exceptions.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse JSON response: {e}")
-            self.logger.error(f"Response text: {response.text}")
-            raise
+        return self.get_page_records(self.decode_response(response))
 
     def post_process(self, row: dict, context: dict | None = None) -> dict | None:
         """Post-process the record.
@@ -365,9 +728,10 @@ class OptiplyStream(RESTStream):
             "id": row.get("id"),
             "type": row.get("type")
         }
-        
+
         # Add all attributes to root level
-        if "attributes" in row:
-            processed_row.update(row["attributes"])
+        attributes = row.get("attributes")
+        if attributes:
+            processed_row.update(attributes)
 
         return processed_row
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import typing as t
-from datetime import datetime
-from importlib import resources
-import time
 
-import requests
 from singer_sdk import typing as th  # JSON Schema typing helpers
 
 from tap_optiply.client import OptiplyStream
 
-# TODO: Delete this is if not using json files for schema definition
-SCHEMAS_DIR = resources.files(__package__) / "schemas"
+# Properties shared by the schemas of all Optiply resources
+ID_PROPERTY = th.Property("id", th.StringType)
+TYPE_PROPERTY = th.Property("type", th.StringType)
+UUID_PROPERTY = th.Property("uuid", th.StringType)
+CREATED_AT_PROPERTY = th.Property("createdAt", th.DateTimeType)
+UPDATED_AT_PROPERTY = th.Property("updatedAt", th.DateTimeType)
+CREATED_FROM_PUBLIC_API_PROPERTY = th.Property("createdFromPublicApi", th.BooleanType)
+REMOTE_ID_MAP_PROPERTY = th.Property("remoteIdMap", th.ObjectType())
+REMOTE_DATA_SYNCED_TO_DATE_PROPERTY = th.Property("remoteDataSyncedToDate", th.DateTimeType)
+ACCOUNT_ID_PROPERTY = th.Property("accountId", th.IntegerType)
+PRODUCT_ID_PROPERTY = th.Property("productId", th.IntegerType)
 
 
 class ProductsStream(OptiplyStream):
@@ -26,16 +31,16 @@ class ProductsStream(OptiplyStream):
     records_jsonpath = "$.data[*]"
     is_timestamp_replication_key = True
 
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
         th.Property("ignored", th.BooleanType),
-        th.Property("uuid", th.StringType),
+        UUID_PROPERTY,
         th.Property("notBeingBought", th.BooleanType),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("stockLevel", th.NumberType),
-        th.Property("createdAt", th.DateTimeType),
-        th.Property("accountId", th.IntegerType),
+        CREATED_AT_PROPERTY,
+        ACCOUNT_ID_PROPERTY,
         th.Property("eanCode", th.StringType),
         th.Property("price", th.StringType),
         th.Property("name", th.StringType),
@@ -47,15 +52,15 @@ class ProductsStream(OptiplyStream):
         th.Property("articleCode", th.StringType),
         th.Property("novel", th.BooleanType),
         th.Property("unlimitedStock", th.BooleanType),
-        th.Property("updatedAt", th.DateTimeType),
+        UPDATED_AT_PROPERTY,
         th.Property("resumingPurchase", th.StringType),
         th.Property("status", th.StringType),
         th.Property("createdAtRemote", th.DateTimeType),
         th.Property("manualServiceLevel", th.CustomType({"type": ["string", "integer", "null"]})),
-        th.Property("remoteIdMap", th.ObjectType()),
-        th.Property("remoteDataSyncedToDate", th.DateTimeType),
+        REMOTE_ID_MAP_PROPERTY,
+        REMOTE_DATA_SYNCED_TO_DATE_PROPERTY,
         th.Property("maximumStock", th.NumberType),
-    ).to_dict()
+    )
 
 
 class SuppliersStream(OptiplyStream):
@@ -68,16 +73,15 @@ class SuppliersStream(OptiplyStream):
     records_jsonpath = "$.data[*]"
     is_timestamp_replication_key = True
 
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
         th.Property("maxLoadCapacity", th.CustomType({"type": ["string", "null"]})),
         th.Property("ignored", th.BooleanType),
-        th.Property("uuid", th.StringType),
+        UUID_PROPERTY,
         th.Property("deliveryTime", th.CustomType({"type": ["integer", "null"]})),
-        th.Property("type", th.StringType),
         th.Property("globalLocationNumber", th.CustomType({"type": ["string", "null"]})),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("lostSalesReaction", th.CustomType({"type": ["string", "integer", "null"]})),
         th.Property("fixedCosts", th.CustomType({"type": ["string", "null"]})),
         th.Property("userReplenishmentPeriod", th.CustomType({"type": ["integer", "null"]})),
@@ -85,17 +89,17 @@ class SuppliersStream(OptiplyStream):
         th.Property("emails", th.ArrayType(th.StringType)),
         th.Property("minimumOrderValue", th.StringType),
         th.Property("containerVolume", th.CustomType({"type": ["string", "null"]})),
-        th.Property("accountId", th.IntegerType),
-        th.Property("createdAt", th.DateTimeType),
+        ACCOUNT_ID_PROPERTY,
+        CREATED_AT_PROPERTY,
         th.Property("backorders", th.BooleanType),
         th.Property("name", th.CustomType({"type": ["string", "null"]})),
         th.Property("reactingToLostSales", th.BooleanType),
         th.Property("backordersReaction", th.CustomType({"type": ["string", "integer", "null"]})),
         th.Property("backorderThreshold", th.CustomType({"type": ["string", "integer", "null"]})),
-        th.Property("updatedAt", th.DateTimeType),
-        th.Property("remoteIdMap", th.ObjectType()),
-        th.Property("remoteDataSyncedToDate", th.DateTimeType),
-    ).to_dict()
+        UPDATED_AT_PROPERTY,
+        REMOTE_ID_MAP_PROPERTY,
+        REMOTE_DATA_SYNCED_TO_DATE_PROPERTY,
+    )
 
 
 class SupplierProductsStream(OptiplyStream):
@@ -108,24 +112,24 @@ class SupplierProductsStream(OptiplyStream):
     records_jsonpath = "$.data[*]"
     is_timestamp_replication_key = True
 
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
-        th.Property("uuid", th.StringType),
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
+        UUID_PROPERTY,
         th.Property("supplierId", th.IntegerType),
         th.Property("deliveryTime", th.NumberType),
         th.Property("notBeingBought", th.BooleanType),
         th.Property("availabilityDate", th.DateTimeType),
         th.Property("availability", th.BooleanType),
         th.Property("freeStock", th.NumberType),
-        th.Property("createdAt", th.DateTimeType),
+        CREATED_AT_PROPERTY,
         th.Property("eanCode", th.StringType),
         th.Property("price", th.StringType),
         th.Property("preferred", th.BooleanType),
-        th.Property("updatedAt", th.DateTimeType),
+        UPDATED_AT_PROPERTY,
         th.Property("resumingPurchase", th.StringType),
-        th.Property("productId", th.IntegerType),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        PRODUCT_ID_PROPERTY,
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("lotSize", th.NumberType),
         th.Property("minimumPurchaseQuantity", th.NumberType),
         th.Property("weight", th.StringType),
@@ -134,9 +138,9 @@ class SupplierProductsStream(OptiplyStream):
         th.Property("skuCode", th.StringType),
         th.Property("articleCode", th.StringType),
         th.Property("status", th.StringType),
-        th.Property("remoteIdMap", th.ObjectType()),
-        th.Property("remoteDataSyncedToDate", th.DateTimeType),
-    ).to_dict()
+        REMOTE_ID_MAP_PROPERTY,
+        REMOTE_DATA_SYNCED_TO_DATE_PROPERTY,
+    )
 
 
 class SellOrdersStream(OptiplyStream):
@@ -149,20 +153,20 @@ class SellOrdersStream(OptiplyStream):
     records_jsonpath = "$.data[*]"
     is_timestamp_replication_key = True
 
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
         th.Property("totalValue", th.StringType),
-        th.Property("createdAt", th.DateTimeType),
-        th.Property("accountId", th.IntegerType),
-        th.Property("uuid", th.StringType),
+        CREATED_AT_PROPERTY,
+        ACCOUNT_ID_PROPERTY,
+        UUID_PROPERTY,
         th.Property("placed", th.DateTimeType),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("completed", th.DateTimeType),
-        th.Property("updatedAt", th.DateTimeType),
-        th.Property("remoteDataSyncedToDate", th.DateTimeType),
-        th.Property("remoteIdMap", th.ObjectType()),
-    ).to_dict()
+        UPDATED_AT_PROPERTY,
+        REMOTE_DATA_SYNCED_TO_DATE_PROPERTY,
+        REMOTE_ID_MAP_PROPERTY,
+    )
 
 
 class BuyOrdersStream(OptiplyStream):
@@ -172,21 +176,22 @@ class BuyOrdersStream(OptiplyStream):
     path = "/buyOrders"
     primary_keys = ["id"]
     replication_key = "updatedAt"
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
+
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
         th.Property("totalValue", th.StringType),
-        th.Property("accountId", th.IntegerType),
-        th.Property("createdAt", th.DateTimeType),
-        th.Property("uuid", th.StringType),
+        ACCOUNT_ID_PROPERTY,
+        CREATED_AT_PROPERTY,
+        UUID_PROPERTY,
         th.Property("placed", th.DateTimeType),
         th.Property("supplierId", th.IntegerType),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("assembly", th.BooleanType),
         th.Property("expectedDeliveryDate", th.DateTimeType),
         th.Property("completed", th.DateTimeType),
-        th.Property("updatedAt", th.DateTimeType),
-    ).to_dict()
+        UPDATED_AT_PROPERTY,
+    )
 
 
 class BuyOrderLinesStream(OptiplyStream):
@@ -196,18 +201,19 @@ class BuyOrderLinesStream(OptiplyStream):
     path = "/buyOrderLines"
     primary_keys = ["id"]
     replication_key = "updatedAt"
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
-        th.Property("createdAt", th.DateTimeType),
-        th.Property("uuid", th.StringType),
+
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
+        CREATED_AT_PROPERTY,
+        UUID_PROPERTY,
         th.Property("quantity", th.NumberType),
-        th.Property("productId", th.IntegerType),
+        PRODUCT_ID_PROPERTY,
         th.Property("buyOrderId", th.IntegerType),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("subtotalValue", th.StringType),
-        th.Property("updatedAt", th.DateTimeType),
-    ).to_dict()
+        UPDATED_AT_PROPERTY,
+    )
 
 
 class ReceiptLinesStream(OptiplyStream):
@@ -217,17 +223,18 @@ class ReceiptLinesStream(OptiplyStream):
     path = "/receiptLines"
     primary_keys = ["id"]
     replication_key = "updatedAt"
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
-        th.Property("createdAt", th.DateTimeType),
-        th.Property("uuid", th.StringType),
+
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
+        CREATED_AT_PROPERTY,
+        UUID_PROPERTY,
         th.Property("quantity", th.NumberType),
         th.Property("occurred", th.DateTimeType),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("buyOrderLineId", th.IntegerType),
-        th.Property("updatedAt", th.DateTimeType),
-    ).to_dict()
+        UPDATED_AT_PROPERTY,
+    )
 
 
 class ProductCompositionsStream(OptiplyStream):
@@ -237,17 +244,18 @@ class ProductCompositionsStream(OptiplyStream):
     path = "/productCompositions"
     primary_keys = ["id"]
     replication_key = "updatedAt"
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
-        th.Property("createdAt", th.DateTimeType),
-        th.Property("uuid", th.StringType),
+
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
+        CREATED_AT_PROPERTY,
+        UUID_PROPERTY,
         th.Property("composedProductId", th.IntegerType),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("partProductId", th.IntegerType),
         th.Property("partQuantity", th.NumberType),
-        th.Property("updatedAt", th.DateTimeType),
-    ).to_dict()
+        UPDATED_AT_PROPERTY,
+    )
 
 
 class PromotionsStream(OptiplyStream):
@@ -257,21 +265,22 @@ class PromotionsStream(OptiplyStream):
     path = "/promotions"
     primary_keys = ["id"]
     replication_key = "updatedAt"
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
-        th.Property("uuid", th.StringType),
+
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
+        UUID_PROPERTY,
         th.Property("endDate", th.DateTimeType),
         th.Property("upliftType", th.StringType),
         th.Property("productCount", th.IntegerType),
         th.Property("enabled", th.BooleanType),
-        th.Property("accountId", th.IntegerType),
-        th.Property("createdAt", th.DateTimeType),
+        ACCOUNT_ID_PROPERTY,
+        CREATED_AT_PROPERTY,
         th.Property("upliftIncrease", th.NumberType),
         th.Property("name", th.StringType),
         th.Property("startDate", th.DateTimeType),
-        th.Property("updatedAt", th.DateTimeType),
-    ).to_dict()
+        UPDATED_AT_PROPERTY,
+    )
 
 
 class PromotionProductsStream(OptiplyStream):
@@ -281,17 +290,18 @@ class PromotionProductsStream(OptiplyStream):
     path = "/promotionProducts"
     primary_keys = ["id"]
     replication_key = "updatedAt"
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
+
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
         th.Property("specificUpliftType", th.StringType),
-        th.Property("createdAt", th.DateTimeType),
-        th.Property("uuid", th.StringType),
-        th.Property("productId", th.IntegerType),
+        CREATED_AT_PROPERTY,
+        UUID_PROPERTY,
+        PRODUCT_ID_PROPERTY,
         th.Property("specificUpliftIncrease", th.NumberType),
         th.Property("promotionId", th.IntegerType),
-        th.Property("updatedAt", th.DateTimeType),
-    ).to_dict()
+        UPDATED_AT_PROPERTY,
+    )
 
 
 class SellOrderLinesStream(OptiplyStream):
@@ -304,99 +314,34 @@ class SellOrderLinesStream(OptiplyStream):
     records_jsonpath = "$.data[*]"
     is_timestamp_replication_key = True
 
-    schema = th.PropertiesList(
-        th.Property("id", th.StringType),
-        th.Property("type", th.StringType),
-        th.Property("createdAt", th.DateTimeType),
-        th.Property("uuid", th.StringType),
+    schema_properties = th.PropertiesList(
+        ID_PROPERTY,
+        TYPE_PROPERTY,
+        CREATED_AT_PROPERTY,
+        UUID_PROPERTY,
         th.Property("quantity", th.NumberType),
-        th.Property("productId", th.IntegerType),
-        th.Property("createdFromPublicApi", th.BooleanType),
+        PRODUCT_ID_PROPERTY,
+        CREATED_FROM_PUBLIC_API_PROPERTY,
         th.Property("subtotalValue", th.StringType),
         th.Property("sellOrderId", th.IntegerType),
-        th.Property("updatedAt", th.DateTimeType),
-    ).to_dict()
-
-    def get_records(
-        self,
-        context: dict | None,
-    ) -> t.Iterable[dict]:
-        """Return a generator of record-type dictionary objects.
-
-        Args:
-            context: Stream partition or context dictionary.
-
-        Yields:
-            One item per (possibly processed) record in the API.
-        """
-        next_page_token: int | None = None
-        finished = False
-        max_updated_at = None
-        retry_count = 0
-
-        while not finished:
-            try:
-                prepared_request = self.prepare_request(
-                    context,
-                    next_page_token=next_page_token,
-                )
-                self.logger.info(f"Making request to: {prepared_request.url}")
-                self.logger.info(f"Request headers: {prepared_request.headers}")
-                
-                resp = self._session.send(prepared_request, timeout=self.request_timeout)
-                self.logger.info(f"Response received with status code: {resp.status_code}")
-                
-                if resp.status_code != 200:
-                    self.logger.error(f"Error response from API: {resp.text}")
-                    if resp.status_code == 504:
-                        if retry_count < self.max_retries:
-                            retry_count += 1
-                            wait_time = self.retry_backoff_factor * (2 ** (retry_count - 1))
-                            self.logger.info(f"Gateway timeout. Retrying in {wait_time} seconds... (Attempt {retry_count}/{self.max_retries})")
-                            time.sleep(wait_time)
-                            continue
-                    raise requests.exceptions.HTTPError(f"HTTP {resp.status_code}: {resp.text}")
-                
-                records = list(self.parse_response(resp))
-                self.logger.info(f"Parsed {len(records)} records from response")
-                
-                # Update max_updated_at if we have records
-                if records:
-                    for record in records:
-                        # Try to get updatedAt from attributes first
-                        updated_at = (record.get('attributes', {}) or {}).get('updatedAt')
-                        if not updated_at:
-                            # If not in attributes, try root level
-                            updated_at = record.get('updatedAt')
-                        
-                        if updated_at:
-                            if max_updated_at is None or updated_at > max_updated_at:
-                                max_updated_at = updated_at
-
-                # Process and yield records
-                for record in records:
-                    processed_record = self.post_process(record, context)
-                    if processed_record:
-                        yield processed_record
-
-                next_page_token = self.get_next_page_token(resp, next_page_token)
-                if not next_page_token:
-                    finished = True
-                    
-            except requests.exceptions.Timeout as e:
-                self.logger.error(f"Request timed out: {str(e)}")
-                if retry_count < self.max_retries:
-                    retry_count += 1
-                    wait_time = self.retry_backoff_factor * (2 ** (retry_count - 1))
-                    self.logger.info(f"Request timed out. Retrying in {wait_time} seconds... (Attempt {retry_count}/{self.max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                raise
-            except Exception as e:
-                self.logger.error(f"Error during record retrieval: {str(e)}")
-                raise
-                
-        # Update state with the maximum updatedAt value after all records are processed
-        if max_updated_at:
-            state_record = {'attributes': {'updatedAt': max_updated_at}}
-            self._increment_stream_state(state_record, context=context)
+        UPDATED_AT_PROPERTY,
+    )
+
+
+# Stream classes by stream name, in discovery order
+STREAM_TYPES: dict[str, type[OptiplyStream]] = {
+    stream_class.name: stream_class
+    for stream_class in (
+        ProductsStream,
+        SuppliersStream,
+        SupplierProductsStream,
+        SellOrdersStream,
+        SellOrderLinesStream,
+        BuyOrdersStream,
+        BuyOrderLinesStream,
+        ReceiptLinesStream,
+        ProductCompositionsStream,
+        PromotionsStream,
+        PromotionProductsStream,
+    )
+}
@@ -2,12 +2,82 @@
 
 from __future__ import annotations
 
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal
+
+import orjson
 from singer_sdk import Tap
+from singer_sdk._singerlib import Message, StateMessage
+from singer_sdk._singerlib.json import serialize_json
 from singer_sdk import typing as th  # JSON schema typing helpers
 
 # TODO: Import your custom stream types here:
 from tap_optiply import streams
 
+# Number of streams synced at the same time
+DEFAULT_MAX_WORKERS = 4
+
+# Datetimes are written as RFC 3339 UTC
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj: object) -> str:
+    """Encode types orjson does not support natively.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        The object as a string, like the SDK's fallback encoder.
+
+    Raises:
+        TypeError: For Decimal values, which must stay JSON numbers.
+    """
+    if isinstance(obj, Decimal):
+        raise TypeError("Decimal values are encoded by the SDK serializer")
+    return str(obj)
+
+
+def _sync_stream(stream: streams.OptiplyStream) -> None:
+    """Sync a single stream and finalize its state.
+
+    Args:
+        stream: The stream to sync.
+    """
+    stream.sync()
+    stream.finalize_state_progress_markers()
+
+
+def run_streams_concurrently(
+    streams_to_sync: list[streams.OptiplyStream],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> None:
+    """Sync independent streams in parallel over a bounded thread pool.
+
+    Args:
+        streams_to_sync: The streams to sync.
+        max_workers: Maximum number of streams synced at the same time.
+    """
+    if not streams_to_sync:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(streams_to_sync))),
+        thread_name_prefix="tap-optiply",
+    ) as executor:
+        futures = {
+            executor.submit(_sync_stream, stream): stream for stream in streams_to_sync
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                # Don't start streams that are still queued, then re-raise
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
 
 class TapOptiply(Tap):
     """Optiply tap class."""
@@ -40,6 +110,12 @@ class TapOptiply(Tap):
             required=True,
             description="The password for the OAuth application",
         ),
+        th.Property(
+            "account_id",
+            th.IntegerType,
+            required=True,
+            description="The ID of the Optiply account to sync",
+        ),
         th.Property(
             "access_token",
             th.StringType,
@@ -55,12 +131,30 @@ class TapOptiply(Tap):
             th.DateTimeType,
             description="The earliest record date to sync",
         ),
+        th.Property(
+            "max_parallel_streams",
+            th.IntegerType(minimum=1),
+            default=DEFAULT_MAX_WORKERS,
+            description="The maximum number of streams synced at the same time",
+        ),
+        th.Property(
+            "time_partition_days",
+            th.IntegerType(minimum=1),
+            description=(
+                "Split initial syncs into updatedAt windows of this many days "
+                "that are fetched in parallel"
+            ),
+        ),
     ).to_dict()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.config_updates = {}
         self.config_file = kwargs.get('config_file')
+        # Streams run in parallel, so message writes and changes to the shared
+        # state must be serialized. Re-entrant, since writing a STATE message
+        # happens while the state is locked.
+        self._write_lock = threading.RLock()
 
     def discover_streams(self) -> list[streams.OptiplyStream]:
         """Return a list of discovered streams.
@@ -69,32 +163,76 @@ class TapOptiply(Tap):
             A list of discovered streams.
         """
         return [
-            streams.ProductsStream(self),
-            streams.SuppliersStream(self),
-            streams.SupplierProductsStream(self),
-            streams.SellOrdersStream(self),
-            streams.SellOrderLinesStream(self),
-            streams.BuyOrdersStream(self),
-            streams.BuyOrderLinesStream(self),
-            streams.ReceiptLinesStream(self),
-            streams.ProductCompositionsStream(self),
-            streams.PromotionsStream(self),
-            streams.PromotionProductsStream(self),
+            stream_class(tap=self)
+            for stream_class in streams.STREAM_TYPES.values()
+            if stream_class.enabled
         ]
 
-    def update_token_state(self, access_token: str, token_expires_at: int) -> None:
-        """Update the token state.
+    def serialize_message(self, message: Message) -> str:
+        """Serialize a Singer message with orjson.
+
+        orjson can't write a Decimal as a JSON number, so messages that carry
+        one (e.g. from stream maps) go through the SDK's serializer instead.
+
+        Args:
+            message: The message to serialize.
+
+        Returns:
+            A single line of JSON.
+        """
+        message_dict = message.to_dict()
+        try:
+            return orjson.dumps(message_dict, default=_orjson_default, option=ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            return serialize_json(message_dict)
+
+    def write_message(self, message: Message) -> None:
+        """Write a message to stdout, one thread at a time.
+
+        Unlike the SDK writer, stdout is not flushed after every record; it is
+        only flushed on STATE messages and at the end of the sync.
 
         Args:
-            access_token: The new access token
-            token_expires_at: The timestamp when the token expires
+            message: The message to write.
         """
-        self.state["access_token"] = access_token
-        self.state["token_expires_at"] = token_expires_at
-        self.write_message({
-            "type": "STATE",
-            "value": self.state
-        })
+        with self._write_lock:
+            sys.stdout.write(self.format_message(message) + "\n")
+            if isinstance(message, StateMessage):
+                sys.stdout.flush()
+
+    # Tap.sync_all is marked @t.final in the SDK. This override mirrors its
+    # body as of singer-sdk 0.44.4, with the per-stream loop replaced by
+    # run_streams_concurrently. Re-check it against the SDK when upgrading.
+    def sync_all(self) -> None:  # type: ignore[misc]
+        """Sync all selected streams in parallel.
+
+        Optiply streams are independent resources, so instead of syncing them
+        one after the other they are handed to a thread pool.
+        """
+        self._reset_state_progress_markers()
+        self._set_compatible_replication_methods()
+        if self.state:
+            self.write_message(StateMessage(value=self.state))
+
+        streams_to_sync = []
+        for stream in self.streams.values():
+            if not stream.selected and not stream.has_selected_descendents:
+                self.logger.info("Skipping deselected stream '%s'.", stream.name)
+                continue
+            if stream.parent_stream_type:
+                continue
+            streams_to_sync.append(stream)
+
+        try:
+            run_streams_concurrently(
+                streams_to_sync,
+                max_workers=self.config.get("max_parallel_streams") or DEFAULT_MAX_WORKERS,
+            )
+        finally:
+            sys.stdout.flush()
+
+        for stream in self.streams.values():
+            stream.log_sync_costs()
 
 
 if __name__ == "__main__":
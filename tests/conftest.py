@@ -0,0 +1,95 @@
+"""Shared fixtures for the tap-optiply tests."""
+
+import json
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from tap_optiply.auth import OptiplyAuthenticator
+from tap_optiply.client import OptiplyStream
+
+API_URL = "https://api.optiply.com/v1"
+
+
+class FakeOptiplyAdapter(BaseAdapter):
+    """Serve paginated JSON:API responses for every resource, without network."""
+
+    def __init__(self, pages: int = 3, page_size: int = 2) -> None:
+        super().__init__()
+        self.pages = pages
+        self.page_size = page_size
+        # (resource, page number) -> (status code, body) served instead of records
+        self.overrides = {}
+        # Access tokens answered with 401 Unauthorized
+        self.revoked_tokens = set()
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.urls.append(request.url)
+
+        url = urlsplit(request.url)
+        resource = url.path.rsplit("/", 1)[-1]
+        page = int(parse_qs(url.query).get("page", ["0"])[0])
+
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if token in self.revoked_tokens:
+            status_code, body = 401, b'{"errors": []}'
+        elif (resource, page) in self.overrides:
+            status_code, body = self.overrides[(resource, page)]
+        else:
+            first = page * self.page_size
+            records = [
+                {
+                    "id": str(index),
+                    "type": resource,
+                    "attributes": {"updatedAt": f"2024-02-{index + 1:02d}T00:00:00+00:00"},
+                }
+                for index in range(first, first + self.page_size)
+            ]
+            links = {}
+            if page + 1 < self.pages:
+                links["next"] = f"{API_URL}/{resource}?page={page + 1}"
+            status_code, body = 200, json.dumps({"data": records, "links": links}).encode()
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/vnd.api+json"})
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Route all stream requests to a FakeOptiplyAdapter."""
+    adapter = FakeOptiplyAdapter()
+    session = requests.Session()
+    session.mount("https://", adapter)
+    monkeypatch.setattr(OptiplyStream, "_shared_session", session)
+    monkeypatch.setattr(OptiplyAuthenticator, "_tokens", {})
+    return adapter
+
+
+@pytest.fixture
+def sync_config():
+    """A complete config with a token that does not need refreshing."""
+    return {
+        "client_id": "client-id",
+        "client_secret": "client-secret",
+        "username": "user@example.com",
+        "password": "password",
+        "account_id": 1,
+        "access_token": "access-token",
+        "token_expires_at": 9999999999,
+        "start_date": "2024-01-01T00:00:00Z",
+    }
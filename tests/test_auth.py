@@ -0,0 +1,130 @@
+"""Tests for the Optiply authenticator."""
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from tap_optiply.auth import OptiplyAuthenticator
+from tap_optiply.tap import TapOptiply
+
+
+class FakeTokenResponse:
+    """A successful response of the OAuth token endpoint."""
+
+    def __init__(self, access_token: str) -> None:
+        self.access_token = access_token
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return {"access_token": self.access_token, "expires_in": 3600}
+
+
+@pytest.fixture
+def token_posts(monkeypatch):
+    """Count token refreshes instead of calling the OAuth endpoint."""
+    posts = []
+
+    def post(url, **kwargs):
+        # Widen the window in which other streams could start a refresh too
+        time.sleep(0.05)
+        posts.append(kwargs["data"]["username"])
+        return FakeTokenResponse(f"token-{len(posts)}")
+
+    monkeypatch.setattr(OptiplyAuthenticator, "_tokens", {})
+    monkeypatch.setattr(OptiplyAuthenticator, "update_config", lambda self, new_fields: None)
+    monkeypatch.setattr("tap_optiply.auth.requests.post", post)
+    return posts
+
+
+@pytest.fixture
+def expired_config(sync_config):
+    """A config whose access token has expired."""
+    return {**sync_config, "access_token": "expired", "token_expires_at": 1}
+
+
+def test_streams_share_one_refresh(token_posts, expired_config):
+    """Streams refreshing an expired token at once send a single token request."""
+    tap = TapOptiply(config=expired_config)
+    authenticators = [stream.authenticator for stream in tap.streams.values()]
+    headers = []
+
+    def authenticate(authenticator):
+        headers.append(authenticator.get_auth_headers()["Authorization"])
+
+    threads = [
+        threading.Thread(target=authenticate, args=(authenticator,))
+        for authenticator in authenticators
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert token_posts == [expired_config["username"]]
+    assert headers == ["Bearer token-1"] * len(authenticators)
+
+
+def test_tokens_are_kept_per_client(token_posts, expired_config):
+    """Taps of other OAuth clients for the same user do not reuse the token."""
+    first = TapOptiply(config=expired_config)
+    second = TapOptiply(config={**expired_config, "client_id": "other-client"})
+
+    first_headers = first.streams["products"].authenticator.get_auth_headers()
+    second_headers = second.streams["products"].authenticator.get_auth_headers()
+
+    assert len(token_posts) == 2
+    assert first_headers["Authorization"] != second_headers["Authorization"]
+
+
+def test_fresh_config_token_is_used(token_posts, expired_config, sync_config):
+    """A later config with a valid token replaces the expired shared token."""
+    TapOptiply(config=expired_config).streams["products"].authenticator
+    tap = TapOptiply(config=sync_config)
+
+    headers = tap.streams["products"].authenticator.get_auth_headers()
+
+    assert token_posts == []
+    assert headers["Authorization"] == f"Bearer {sync_config['access_token']}"
+
+
+def test_concurrent_rejections_refresh_once(fake_api, token_posts, sync_config, monkeypatch):
+    """Requests rejected with the same token refresh it only once between them."""
+    old_authorization = f"Bearer {sync_config['access_token']}"
+    fake_api.revoked_tokens.add(sync_config["access_token"])
+    send = fake_api.send
+    both_sent = threading.Barrier(2, timeout=5)
+    rejections = itertools.count()
+    refreshed = threading.Event()
+
+    def send_in_order(request, **kwargs):
+        if request.headers["Authorization"] == old_authorization:
+            both_sent.wait()
+            # The second 401 arrives after the first one led to a new token
+            if next(rejections) > 0:
+                refreshed.wait(timeout=5)
+        else:
+            refreshed.set()
+        return send(request, **kwargs)
+
+    monkeypatch.setattr(fake_api, "send", send_in_order)
+    tap = TapOptiply(config=sync_config)
+    records = {}
+
+    def sync(stream):
+        records[stream.name] = list(stream.get_records(None))
+
+    threads = [
+        threading.Thread(target=sync, args=(tap.streams[name],))
+        for name in ("products", "suppliers")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert token_posts == [sync_config["username"]]
+    assert [len(stream_records) for stream_records in records.values()] == [6, 6]
@@ -0,0 +1,214 @@
+"""Tests for the OptiplyStream base class."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+import pytest
+import requests
+
+from tap_optiply.client import split_time_range
+from tap_optiply.tap import TapOptiply
+
+
+def test_split_time_range():
+    """A range is split into consecutive windows, the last one cut at the end."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 1, 11, tzinfo=timezone.utc)
+
+    windows = list(split_time_range(start, end, timedelta(days=3)))
+
+    assert windows == [
+        ("2024-01-01T00:00:00+00:00", "2024-01-04T00:00:00+00:00"),
+        ("2024-01-04T00:00:00+00:00", "2024-01-07T00:00:00+00:00"),
+        ("2024-01-07T00:00:00+00:00", "2024-01-10T00:00:00+00:00"),
+        ("2024-01-10T00:00:00+00:00", "2024-01-11T00:00:00+00:00"),
+    ]
+
+
+@pytest.mark.parametrize("days", [0, -30])
+def test_split_time_range_rejects_non_positive_step(days):
+    """A window length that never moves forward is rejected instead of looping."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    with pytest.raises(ValueError):
+        next(split_time_range(start, end, timedelta(days=days)))
+
+
+def test_time_partitions_of_initial_sync(sync_config):
+    """An initial sync is split into windows from start_date up to now."""
+    tap = TapOptiply(config={**sync_config, "time_partition_days": 365})
+    stream = tap.streams["products"]
+
+    windows = stream.get_time_partitions(None)
+
+    assert len(windows) > 1
+    assert windows[0][0] == "2024-01-01T00:00:00+00:00"
+    for (_, upper), (lower, _) in zip(windows, windows[1:]):
+        assert upper == lower
+    assert datetime.fromisoformat(windows[-1][1]) <= datetime.now(timezone.utc)
+
+
+def test_time_partitions_disabled_by_default(sync_config):
+    """Without time_partition_days the stream is paged through sequentially."""
+    tap = TapOptiply(config=sync_config)
+
+    assert tap.streams["products"].get_time_partitions(None) == []
+
+
+def test_time_partitions_skipped_with_bookmark(sync_config):
+    """Once a stream has a bookmark, its sync is not partitioned."""
+    state = {"bookmarks": {"products": {"updatedAt": "2024-06-01T00:00:00+00:00"}}}
+    tap = TapOptiply(config={**sync_config, "time_partition_days": 30}, state=state)
+
+    assert tap.streams["products"].get_time_partitions(None) == []
+
+
+def test_partitioned_records(fake_api, sync_config):
+    """Every window is fetched with its own bounds and all its pages are emitted."""
+    tap = TapOptiply(config={**sync_config, "time_partition_days": 365})
+    stream = tap.streams["products"]
+    windows = stream.get_time_partitions(None)
+
+    records = list(stream.get_records(None))
+
+    assert len(records) == len(windows) * 6
+    # Windows end at "now", so only the lower bounds are compared exactly
+    first_page_queries = [
+        query
+        for query in (parse_qs(urlsplit(url).query) for url in fake_api.urls)
+        if "filter[updatedAt][LTE]" in query
+    ]
+    assert len(first_page_queries) == len(windows)
+    assert {query["filter[updatedAt][GTE]"][0] for query in first_page_queries} == {
+        lower for lower, _ in windows
+    }
+
+
+def test_partitioned_records_buffer_bounded(fake_api, sync_config):
+    """Windows stop fetching while the consumer is behind, and stop on close."""
+    fake_api.pages = 50
+    tap = TapOptiply(config={**sync_config, "time_partition_days": 30})
+    stream = tap.streams["products"]
+    records = stream.get_records(None)
+
+    next(records)
+    time.sleep(0.3)
+    # Queued pages, the page waiting to be queued and the prefetched one
+    max_pages = stream.partition_max_workers * (stream.partition_max_buffered_pages + 3)
+    assert len(fake_api.urls) <= max_pages
+
+    started = time.monotonic()
+    records.close()
+    assert time.monotonic() - started < 1
+
+
+def test_partitioned_window_error(fake_api, sync_config):
+    """An error in a window is raised once the earlier records are emitted."""
+    fake_api.pages = 50
+    fake_api.overrides[("products", 1)] = (500, b'{"errors": []}')
+    tap = TapOptiply(config={**sync_config, "time_partition_days": 30})
+    records = tap.streams["products"].get_records(None)
+
+    assert [next(records)["id"], next(records)["id"]] == ["0", "1"]
+    with pytest.raises(requests.exceptions.HTTPError, match="HTTP 500"):
+        next(records)
+
+
+def test_prefetched_pages_in_order(fake_api, sync_config):
+    """Pages requested ahead of time are still emitted in link order."""
+    tap = TapOptiply(config=sync_config)
+
+    records = list(tap.streams["products"].get_records(None))
+
+    assert [record["id"] for record in records] == [str(index) for index in range(6)]
+    assert len(fake_api.urls) == 3
+
+
+def test_prefetched_page_error(fake_api, sync_config):
+    """An error on a prefetched page is raised after the earlier pages are emitted."""
+    fake_api.overrides[("products", 1)] = (500, b'{"errors": []}')
+    tap = TapOptiply(config=sync_config)
+    records = tap.streams["products"].get_records(None)
+
+    assert [next(records)["id"], next(records)["id"]] == ["0", "1"]
+    with pytest.raises(requests.exceptions.HTTPError, match="HTTP 500"):
+        next(records)
+
+
+def test_malformed_page(fake_api, sync_config, caplog):
+    """A page that is not JSON fails the stream with the response logged."""
+    fake_api.overrides[("products", 1)] = (200, b"<html>Bad gateway</html>")
+    tap = TapOptiply(config=sync_config)
+    stream = tap.streams["products"]
+    # The SDK replaces the root logging handlers, so listen on the stream logger
+    stream.logger.addHandler(caplog.handler)
+
+    try:
+        with pytest.raises(orjson.JSONDecodeError):
+            list(stream.get_records(None))
+    finally:
+        stream.logger.removeHandler(caplog.handler)
+
+    assert "Failed to parse JSON response" in caplog.text
+    assert "<html>Bad gateway</html>" in caplog.text
+
+
+def test_bookmark_advanced_per_record(fake_api, sync_config, capsys, monkeypatch):
+    """The SDK updates the bookmark once per record, with no extra page updates."""
+    tap = TapOptiply(config=sync_config)
+    stream = tap.streams["products"]
+    calls = []
+    increment_stream_state = stream._increment_stream_state
+
+    def spy(latest_record, *, context=None):
+        calls.append(latest_record["id"])
+        increment_stream_state(latest_record, context=context)
+
+    monkeypatch.setattr(stream, "_increment_stream_state", spy)
+    stream.sync()
+
+    assert calls == [str(index) for index in range(6)]
+    assert stream.stream_state["updatedAt"] == "2024-02-06T00:00:00+00:00"
+
+
+def test_records_requested_sorted(fake_api, sync_config):
+    """The first page asks for records in ascending updatedAt order."""
+    tap = TapOptiply(config=sync_config)
+
+    list(tap.streams["products"].get_records(None))
+
+    query = parse_qs(urlsplit(fake_api.urls[0]).query)
+    assert query["sort"] == ["updatedAt"]
+
+
+def test_first_page_filtered_from_start_date(fake_api, sync_config):
+    """Without a bookmark, records are requested from start_date on."""
+    tap = TapOptiply(config=sync_config)
+
+    list(tap.streams["products"].get_records(None))
+
+    query = parse_qs(urlsplit(fake_api.urls[0]).query)
+    assert query["filter[updatedAt][GTE]"] == ["2024-01-01T00:00:00+00:00"]
+
+
+def test_first_page_filtered_from_bookmark(fake_api, sync_config):
+    """With a bookmark, records are requested from the bookmark on."""
+    state = {"bookmarks": {"products": {"updatedAt": "2024-06-01T00:00:00Z"}}}
+    tap = TapOptiply(config=sync_config, state=state)
+
+    list(tap.streams["products"].get_records(None))
+
+    query = parse_qs(urlsplit(fake_api.urls[0]).query)
+    assert query["filter[updatedAt][GTE]"] == ["2024-06-01T00:00:00+00:00"]
+
+
+def test_compressed_responses_requested(sync_config):
+    """Requests ask the API for gzip compressed responses."""
+    tap = TapOptiply(config=sync_config)
+
+    request = tap.streams["products"].prepare_request(None, next_page_token=None)
+
+    assert "gzip" in request.headers["Accept-Encoding"]
@@ -0,0 +1,83 @@
+"""Tests for the tap-level sync of tap-optiply."""
+
+import datetime
+import json
+import sys
+from decimal import Decimal
+
+import pytest
+from singer_sdk._singerlib import RecordMessage
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_optiply import streams
+from tap_optiply.tap import TapOptiply
+
+
+@pytest.fixture
+def fast_thread_switching():
+    """Switch threads as often as possible to surface races."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_parallel_sync_all(fake_api, sync_config, capsys, monkeypatch, fast_thread_switching):
+    """Streams synced in parallel share the tap state without corrupting it."""
+    # Check for pending STATE after every record, so snapshots overlap with updates
+    monkeypatch.setattr(streams.OptiplyStream, "STATE_MSG_FREQUENCY", 1)
+
+    for _ in range(60):
+        tap = TapOptiply(config={**sync_config, "max_parallel_streams": 11})
+        tap.sync_all()
+
+        messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        records = [message for message in messages if message["type"] == "RECORD"]
+        assert len(records) == len(streams.STREAM_TYPES) * 6
+
+        final_state = [message for message in messages if message["type"] == "STATE"][-1]
+        bookmarks = final_state["value"]["bookmarks"]
+        assert set(bookmarks) == set(streams.STREAM_TYPES)
+        for bookmark in bookmarks.values():
+            assert bookmark["updatedAt"] == "2024-02-06T00:00:00+00:00"
+
+
+def test_max_parallel_streams_null(fake_api, sync_config, capsys):
+    """A null max_parallel_streams falls back to the default pool size."""
+    tap = TapOptiply(config={**sync_config, "max_parallel_streams": None})
+    tap.sync_all()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sum(message["type"] == "RECORD" for message in messages) == len(streams.STREAM_TYPES) * 6
+
+
+def test_max_parallel_streams_minimum(sync_config):
+    """At least one stream must be allowed to sync."""
+    with pytest.raises(ConfigValidationError):
+        TapOptiply(config={**sync_config, "max_parallel_streams": 0})
+
+
+def test_serialize_record(sync_config):
+    """Records are written as compact JSON with UTC timestamps."""
+    tap = TapOptiply(config=sync_config)
+    message = RecordMessage(
+        stream="products",
+        record={"id": "1", "remoteIdMap": {"shop": "a"}},
+        time_extracted=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+
+    assert tap.serialize_message(message) == (
+        '{"type":"RECORD","stream":"products","record":{"id":"1","remoteIdMap":{"shop":"a"}},'
+        '"time_extracted":"2024-01-01T00:00:00Z"}'
+    )
+
+
+def test_serialize_decimal(sync_config):
+    """Decimal values stay exact JSON numbers."""
+    tap = TapOptiply(config=sync_config)
+    message = RecordMessage(stream="products", record={"price": Decimal("1.10")})
+
+    line = tap.serialize_message(message)
+
+    assert '"price":1.10' in line
+    assert json.loads(line, parse_float=Decimal)["record"]["price"] == Decimal("1.10")